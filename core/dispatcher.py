@@ -1,5 +1,7 @@
+import time
 import importlib
 from core.feed_parser import FeedParser
+from core.profiler import stage
 
 def dispatch_parser(
     subject: str,
@@ -8,7 +10,10 @@ def dispatch_parser(
     source_title: str = "Unknown Source",
     max_items: int = 5,
     filter_tree: dict = None,
-    verbose: bool = False
+    verbose: bool = False,
+    fetcher=None,
+    fetch_timeout: float = None,
+    timings: dict = None
 ) -> dict:
     import importlib
     from core.feed_parser import FeedParser
@@ -19,6 +24,32 @@ def dispatch_parser(
     if not feed_url:
         return {}
 
+    # Fetch time covers network and parsing, not the per-host politeness wait
+    waited = fetcher.waited_seconds if fetcher else 0.0
+    started = time.monotonic()
+    with stage("fetch"):
+        all_entries = _fetch_entries(subject, feed_url, parser_name, sub_subject, source_title,
+                                     max_items, verbose, fetcher, fetch_timeout)
+    if timings is not None:
+        waited = (fetcher.waited_seconds if fetcher else 0.0) - waited
+        timings["fetch_seconds"] = time.monotonic() - started - waited
+
+    parser = FeedParser(feed_url, source_title=source_title, max_items=max_items, verbose=verbose)
+
+    if isinstance(filter_tree, dict):
+        with stage("filter"):
+            categorized = {}
+            for category_name, category_config in filter_tree.items():
+                cat_filter = category_config.get("filters", {})
+                matched = [e for e in all_entries if parser.match_filter_tree(e, cat_filter)]
+                if matched:
+                    categorized[category_name] = matched
+        return categorized
+
+    return {"General": all_entries}
+
+def _fetch_entries(subject, feed_url, parser_name, sub_subject, source_title, max_items, verbose, fetcher,
+                   fetch_timeout):
     def try_parse(module):
         try:
             return module.parse(feed_url, source_title=source_title, max_items=max_items)
@@ -42,18 +73,8 @@ def dispatch_parser(
                 module = importlib.import_module(f"parsers.rss_parsers.{subject}.general")
             all_entries = try_parse(module)
         except ModuleNotFoundError:
-            parser = FeedParser(feed_url, source_title=source_title, max_items=max_items, verbose=verbose)
+            parser = FeedParser(feed_url, source_title=source_title, max_items=max_items, verbose=verbose,
+                                fetcher=fetcher, fetch_timeout=fetch_timeout)
             all_entries = parser.parse()
 
-    parser = FeedParser(feed_url, source_title=source_title, max_items=max_items, verbose=verbose)
-
-    if isinstance(filter_tree, dict):
-        categorized = {}
-        for category_name, category_config in filter_tree.items():
-            cat_filter = category_config.get("filters", {})
-            matched = [e for e in all_entries if parser.match_filter_tree(e, cat_filter)]
-            if matched:
-                categorized[category_name] = matched
-        return categorized
-
-    return {"General": all_entries}
\ No newline at end of file
+    return all_entries
@@ -1,13 +1,18 @@
 import feedparser
 import html
+from core.http_fetcher import FetchError
+from core.profiler import stage
 
 class FeedParser:
-    def __init__(self, feed_url, source_title="Unknown Source", max_items=5, filter_tree=None, verbose=False):
+    def __init__(self, feed_url, source_title="Unknown Source", max_items=5, filter_tree=None, verbose=False, fetcher=None,
+                 fetch_timeout=None):
         self.feed_url = feed_url
         self.source_title = source_title
         self.max_items = max_items
         self.filter_tree = filter_tree
         self.verbose = verbose
+        self.fetcher = fetcher
+        self.fetch_timeout = fetch_timeout
 
     def match_filter_tree(self, entry, node):
         if not node or (not node.get("keyword") and not node.get("children")):
@@ -50,8 +55,26 @@ class FeedParser:
         # Combine keyword and children results
         return keyword_result and children_result
 
+    def fetch(self):
+        # Without a shared fetcher, or for local files and non-http(s) URLs,
+        # feedparser opens the source itself
+        if self.fetcher is None or not self.fetcher.supports(self.feed_url):
+            with stage("feedparser"):
+                return feedparser.parse(self.feed_url)
+        try:
+            with stage("http"):
+                body, headers, _ = self.fetcher.fetch(self.feed_url, timeout=self.fetch_timeout)
+        except FetchError as e:
+            if self.verbose:
+                print(f"[ERROR] Failed to fetch feed {self.feed_url}: {e}")
+            return None
+        with stage("feedparser"):
+            return feedparser.parse(body, response_headers=headers)
+
     def parse(self):
-        feed = feedparser.parse(self.feed_url)
+        feed = self.fetch()
+        if feed is None:
+            return []
         if feed.bozo:
             if self.verbose:
                 print(f"[ERROR] Failed to parse feed: {feed.bozo_exception}")
@@ -0,0 +1,190 @@
+import time
+import zlib
+import logging
+import http.client
+from urllib.parse import urlsplit, urljoin
+
+USER_AGENT = "rss_feed_keywords_parser/1.0 (+feedparser)"
+REDIRECT_CODES = {301, 302, 303, 307, 308}
+MAX_REDIRECTS = 5
+READ_CHUNK = 8 * 1024
+
+class FetchError(Exception):
+    pass
+
+class HttpFetcher:
+    """
+    Shared fetch layer: one keep-alive connection per host, gzip/deflate
+    negotiation, a hard per-request deadline, a body size cap and a minimum
+    delay between two requests to the same host.
+    """
+
+    def __init__(self, timeout=15.0, max_bytes=10 * 1024 * 1024, host_delay=0.5, verbose=False):
+        self.timeout = timeout
+        self.max_bytes = max_bytes
+        self.host_delay = host_delay
+        self.verbose = verbose
+        self.connections = {}
+        self.last_request = {}
+        self.waited_seconds = 0.0  # total politeness wait, excluded from fetch timings
+
+    def _connection(self, key):
+        conn = self.connections.get(key)
+        if conn is None:
+            scheme, host, port = key
+            conn_class = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+            conn = conn_class(host, port, timeout=self.timeout)
+            self.connections[key] = conn
+        return conn
+
+    def _drop(self, key):
+        conn = self.connections.pop(key, None)
+        if conn is not None:
+            conn.close()
+
+    def _wait_for_host(self, host):
+        last = self.last_request.get(host)
+        if last is not None:
+            wait = self.host_delay - (time.monotonic() - last)
+            if wait > 0:
+                time.sleep(wait)
+                self.waited_seconds += wait
+        self.last_request[host] = time.monotonic()
+
+    def _remaining(self, deadline):
+        left = deadline - time.monotonic()
+        if left <= 0:
+            raise FetchError(f"timed out after {self.timeout}s")
+        return left
+
+    def _read_body(self, response, sock, deadline):
+        chunks = []
+        size = 0
+        while True:
+            # read1() returns whatever is buffered, so a slow server cannot hold
+            # a single read past the deadline
+            sock.settimeout(self._remaining(deadline))
+            chunk = response.read1(READ_CHUNK)
+            if not chunk:
+                break
+            size += len(chunk)
+            if size > self.max_bytes:
+                raise FetchError(f"body exceeds {self.max_bytes} bytes")
+            chunks.append(chunk)
+        # read1() does not release the response at end of body; the socket stays pooled
+        response.close()
+        return b"".join(chunks)
+
+    def _decode(self, body, encoding):
+        encoding = (encoding or "").strip().lower()
+        if encoding in ("", "identity"):
+            return body
+        if encoding in ("gzip", "x-gzip"):
+            decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        elif encoding == "deflate":
+            # Some servers send raw deflate instead of zlib-wrapped data
+            wbits = zlib.MAX_WBITS if body[:1] == b"\x78" else -zlib.MAX_WBITS
+            decompressor = zlib.decompressobj(wbits)
+        else:
+            raise FetchError(f"unsupported content encoding: {encoding}")
+        try:
+            data = decompressor.decompress(body, self.max_bytes + 1)
+        except zlib.error as e:
+            raise FetchError(f"invalid {encoding} body: {e}")
+        if len(data) > self.max_bytes:
+            raise FetchError(f"decoded body exceeds {self.max_bytes} bytes")
+        return data
+
+    @staticmethod
+    def supports(url):
+        parts = urlsplit(url)
+        return parts.scheme in ("http", "https") and bool(parts.hostname)
+
+    def _request(self, url, time_left):
+        if not self.supports(url):
+            raise FetchError(f"unsupported URL: {url}")
+        parts = urlsplit(url)
+        key = (parts.scheme, parts.hostname, parts.port)
+        path = parts.path or "/"
+        if parts.query:
+            path = f"{path}?{parts.query}"
+        headers = {
+            "User-Agent": USER_AGENT,
+            "Accept-Encoding": "gzip, deflate",
+            "Accept": "application/rss+xml, application/atom+xml, application/xml;q=0.9, */*;q=0.8",
+            "Connection": "keep-alive",
+        }
+
+        # The politeness wait is not part of the fetch timeout
+        self._wait_for_host(parts.hostname)
+        started = time.monotonic()
+        deadline = started + time_left
+
+        # A pooled connection may have been closed by the server; retry once on a fresh one
+        for attempt in range(2):
+            conn = self._connection(key)
+            reused = conn.sock is not None
+            try:
+                # Bound connect, TLS handshake and header wait by the time left
+                conn.timeout = self._remaining(deadline)
+                if reused:
+                    conn.sock.settimeout(conn.timeout)
+                conn.request("GET", path, headers=headers)
+                # getresponse() may detach the socket from conn when the server closes
+                sock = conn.sock
+                response = conn.getresponse()
+                break
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                self._drop(key)
+                if attempt or not reused:
+                    raise
+            except Exception:
+                self._drop(key)
+                raise
+
+        try:
+            body = self._read_body(response, sock, deadline)
+        except Exception:
+            self._drop(key)
+            raise
+        if response.will_close:
+            self._drop(key)
+        return response, body, time.monotonic() - started
+
+    def fetch(self, url, timeout=None):
+        """
+        Fetch a URL and return (body, headers, final_url). The body is
+        decompressed; header names are lower-cased for feedparser. A per-call
+        timeout can only shorten the fetcher's own timeout.
+        """
+        time_left = self.timeout if timeout is None else min(self.timeout, timeout)
+        for _ in range(MAX_REDIRECTS + 1):
+            try:
+                response, body, spent = self._request(url, time_left)
+                time_left -= spent
+            except FetchError:
+                raise
+            except Exception as e:
+                raise FetchError(f"{type(e).__name__}: {e}")
+
+            if response.status in REDIRECT_CODES and response.getheader("Location"):
+                url = urljoin(url, response.getheader("Location"))
+                if self.verbose:
+                    print(f"[HTTP] Redirect {response.status} → {url}")
+                continue
+            if response.status >= 400:
+                raise FetchError(f"HTTP {response.status} {response.reason}")
+
+            headers = {k.lower(): v for k, v in response.getheaders()}
+            body = self._decode(body, headers.pop("content-encoding", ""))
+            headers.pop("content-length", None)
+            headers["content-location"] = url
+            if self.verbose:
+                print(f"[HTTP] {response.status} {url} ({len(body)} bytes)")
+            return body, headers, url
+        raise FetchError(f"too many redirects for {url}")
+
+    def close(self):
+        for key in list(self.connections):
+            self._drop(key)
+        logging.debug("HTTP connection pool closed")
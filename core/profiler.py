@@ -0,0 +1,137 @@
+import os
+import sys
+import time
+import logging
+import threading
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+from collections import Counter, defaultdict
+
+COLLAPSED_FILENAME = "profile.collapsed"
+REPORT_FILENAME = "profile_report.txt"
+TRACEMALLOC_FRAMES = 10
+
+# Set by RunProfiler.start(); while it is None, stage() returns a shared no-op context
+_active = None
+_NULL_STAGE = nullcontext()
+
+def stage(name):
+    """
+    Scope the enclosed code to a pipeline stage (fetch, filter, write...) or a
+    feed. Costs a single function call when profiling is off.
+    """
+    if _active is None:
+        return _NULL_STAGE
+    return _active.stage(name)
+
+class RunProfiler:
+    """
+    Wall-clock sampling profiler plus tracemalloc accounting, both keyed by the
+    current stage path. The main thread is sampled on a fixed timer, so time
+    blocked in socket reads or sleeps is counted like time spent computing.
+    Writes collapsed stacks for flamegraph tools and a text report with
+    per-stage time/memory and the top-N allocation sites.
+    """
+
+    def __init__(self, output_dir="profile", interval=0.005, top_n=20):
+        self.output_dir = output_dir
+        self.interval = interval
+        self.top_n = top_n
+        self.labels = ()
+        self.samples = Counter()
+        self.stage_seconds = defaultdict(float)
+        self.stage_bytes = defaultdict(int)
+        self.stage_calls = Counter()
+        self.target_thread = threading.get_ident()
+        self.stop_event = threading.Event()
+        self.sampler = None
+        self.start_snapshot = None
+        self.started = None
+
+    @contextmanager
+    def stage(self, name):
+        parent = self.labels
+        # ';' separates frames in collapsed stacks
+        self.labels = parent + (name.replace(";", ","),)
+        path = ";".join(self.labels)
+        mem_before = tracemalloc.get_traced_memory()[0]
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.stage_seconds[path] += time.perf_counter() - t0
+            self.stage_bytes[path] += tracemalloc.get_traced_memory()[0] - mem_before
+            self.stage_calls[path] += 1
+            self.labels = parent
+
+    @staticmethod
+    def frame_name(frame):
+        code = frame.f_code
+        return f"{os.path.basename(code.co_filename)}:{code.co_name}"
+
+    def sample_loop(self):
+        while not self.stop_event.wait(self.interval):
+            frame = sys._current_frames().get(self.target_thread)
+            if frame is None:
+                continue
+            stack = []
+            while frame is not None:
+                stack.append(self.frame_name(frame))
+                frame = frame.f_back
+            labels = self.labels or ("(no stage)",)
+            self.samples[";".join(labels + tuple(reversed(stack)))] += 1
+
+    def start(self):
+        global _active
+        tracemalloc.start(TRACEMALLOC_FRAMES)
+        self.start_snapshot = tracemalloc.take_snapshot()
+        self.started = time.perf_counter()
+        self.sampler = threading.Thread(target=self.sample_loop, name="profiler-sampler", daemon=True)
+        self.sampler.start()
+        _active = self
+
+    def stop(self):
+        global _active
+        _active = None
+        self.stop_event.set()
+        self.sampler.join()
+        total = time.perf_counter() - self.started
+        end_snapshot = tracemalloc.take_snapshot()
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+        os.makedirs(self.output_dir, exist_ok=True)
+        collapsed_path = os.path.join(self.output_dir, COLLAPSED_FILENAME)
+        report_path = os.path.join(self.output_dir, REPORT_FILENAME)
+        try:
+            with open(collapsed_path, "w", encoding="utf-8") as f:
+                for stack, count in self.samples.most_common():
+                    f.write(f"{stack} {count}\n")
+            with open(report_path, "w", encoding="utf-8") as f:
+                self.write_report(f, total, peak, end_snapshot)
+        except Exception as e:
+            logging.error(f"Failed to write profile output to {self.output_dir}: {e}")
+            return
+        logging.info(f"Profile written to {collapsed_path} and {report_path}")
+
+    def write_report(self, f, total, peak, end_snapshot):
+        f.write(f"# Run profile\n\nWall time: {total:.3f}s, "
+                f"{sum(self.samples.values())} wall-clock samples every {self.interval * 1000:.1f}ms, "
+                f"peak traced memory: {peak / 1024:.1f} KiB\n\n")
+
+        f.write("## Stages\n\n")
+        f.write(f"{'seconds':>10} {'calls':>7} {'net KiB':>10}  stage\n")
+        for path, seconds in sorted(self.stage_seconds.items(), key=lambda kv: -kv[1]):
+            f.write(f"{seconds:10.3f} {self.stage_calls[path]:7d} "
+                    f"{self.stage_bytes[path] / 1024:10.1f}  {path}\n")
+
+        f.write(f"\n## Top {self.top_n} allocation sites (run end vs start)\n\n")
+        filters = [
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, __file__),
+        ]
+        stats = end_snapshot.filter_traces(filters).compare_to(
+            self.start_snapshot.filter_traces(filters), "lineno"
+        )
+        for stat in stats[:self.top_n]:
+            f.write(f"{stat}\n")
@@ -2,6 +2,8 @@ import os
 import logging
 from writers.md_writer import MarkdownWriter
 from writers.obsidian_markdown_writer import ObsidianMarkdownWriter
+from writers.jsonl_writer import JsonlWriter
+from writers.sqlite_writer import SqliteWriter
 
 
 logging.basicConfig(
@@ -12,18 +14,44 @@ logging.basicConfig(
 
 
 
+WRITERS = {
+    "standard": MarkdownWriter,
+    "obsidian": ObsidianMarkdownWriter,
+    "jsonl": JsonlWriter,
+    "sqlite": SqliteWriter,
+}
+
 class RssNoteRouter:
     def __init__(self, output_dir="vault", mode="standard"):
         self.output_dir = output_dir
+        # A single mode or a list of modes; every writer gets the same entries
+        self.modes = [mode] if isinstance(mode, str) else list(mode)
         self.mode = mode
 
-        if mode == "standard":
-            self.writer = MarkdownWriter(output_dir=output_dir)
-        elif mode == "obsidian":
-            self.writer = ObsidianMarkdownWriter(output_dir=output_dir)
-        else:
-            raise ValueError(f"Unsupported mode: {mode}")
+        self.writers = []
+        for m in self.modes:
+            if m not in WRITERS:
+                raise ValueError(f"Unsupported mode: {m}")
+            self.writers.append(WRITERS[m](output_dir=output_dir))
+        self.writer = self.writers[0]
 
     def write_subject_note(self, subject, sub_subject, source_title, categorized_entries):
-        # Just delegate — no business logic here
-        return self.writer.write_subject_note(subject, sub_subject, source_title, categorized_entries)
+        # Just delegate — no business logic here. Bulk writers return None (unknown);
+        # None is returned when no Markdown writer reported a new-entry count
+        counts = [
+            writer.write_subject_note(subject, sub_subject, source_title, categorized_entries)
+            for writer in self.writers
+        ]
+        return min((c for c in counts if c is not None), default=None)
+
+    def close(self):
+        # Bulk writers flush their buffered rows here; one failure must not drop the others
+        errors = []
+        for writer in self.writers:
+            if hasattr(writer, "close"):
+                try:
+                    writer.close()
+                except Exception as e:
+                    errors.append(e)
+        if errors:
+            raise errors[0]
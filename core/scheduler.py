@@ -0,0 +1,143 @@
+import os
+import json
+import time
+import logging
+
+STATE_FILENAME = ".feed_schedule.json"
+EWMA_ALPHA = 0.3          # weight of the latest run in the historical averages
+RESERVE_RATIO = 0.05      # share of the budget kept for writers and shutdown
+MIN_FETCH_SECONDS = 0.01
+
+class FeedScheduler:
+    """
+    Orders feeds by carry-over, priority and historical value (new entries per
+    second of fetch time) and stops scheduling fetches once the time budget is
+    nearly spent. Skipped feeds are stored and moved to the front of the next run.
+    """
+
+    def __init__(self, output_dir="vault", time_budget=None, fetch_timeout=15.0):
+        self.state_path = os.path.join(output_dir, STATE_FILENAME)
+        self.time_budget = time_budget
+        self.fetch_timeout = fetch_timeout
+        self.started = time.monotonic()
+        self.stats = {}
+        self.carry_over = []
+        self.skipped = []
+        self.scheduled = set()
+        self.fetched = 0
+        self.load()
+
+    @staticmethod
+    def feed_key(item):
+        subject, sub_subject, feed = item[0], item[1], item[2]
+        return f"{subject}/{sub_subject}/{feed.get('url') or feed.get('title', '')}"
+
+    def load(self):
+        if not os.path.exists(self.state_path):
+            return
+        try:
+            with open(self.state_path, "r", encoding="utf-8") as f:
+                state = json.load(f)
+            self.stats = state.get("stats", {})
+            self.carry_over = state.get("carry_over", [])
+        except Exception as e:
+            logging.error(f"Failed to read schedule state {self.state_path}: {e}")
+
+    def save(self):
+        # Keep carry-over from groups that were not part of this run
+        kept = [key for key in self.carry_over if key not in self.scheduled]
+        state = {"stats": self.stats, "carry_over": self.skipped + kept}
+        try:
+            os.makedirs(os.path.dirname(self.state_path) or ".", exist_ok=True)
+            with open(self.state_path, "w", encoding="utf-8") as f:
+                json.dump(state, f, indent=2)
+        except Exception as e:
+            logging.error(f"Failed to write schedule state {self.state_path}: {e}")
+
+    def value(self, key):
+        stat = self.stats.get(key)
+        if not stat:
+            return float("inf")  # never measured: fetch early to learn its value
+        if stat.get("new_entries") is None:
+            return 0.0  # only bulk writers ran, new entries unknown: fall back to priority
+        return stat["new_entries"] / max(stat["fetch_seconds"], MIN_FETCH_SECONDS)
+
+    def estimate(self, key):
+        # A fetch never lasts longer than the fetcher timeout
+        return min(self.stats[key]["fetch_seconds"], self.fetch_timeout)
+
+    @staticmethod
+    def priority(feed):
+        try:
+            return float(feed.get("priority", 0) or 0)
+        except (TypeError, ValueError):
+            logging.warning(f"Ignoring non-numeric priority {feed.get('priority')!r} for '{feed.get('title', feed.get('url'))}'")
+            return 0.0
+
+    def order(self, flat_feeds):
+        carried = {key: rank for rank, key in enumerate(self.carry_over)}
+        self.scheduled.update(self.feed_key(item) for item in flat_feeds)
+
+        def sort_key(item):
+            key = self.feed_key(item)
+            return (
+                0 if key in carried else 1,
+                carried.get(key, 0),
+                -self.priority(item[2]),
+                -self.value(key),
+            )
+
+        return sorted(flat_feeds, key=sort_key)
+
+    def elapsed(self):
+        return time.monotonic() - self.started
+
+    def remaining(self):
+        if self.time_budget is None:
+            return float("inf")
+        return self.time_budget - self.elapsed()
+
+    def should_fetch(self, item):
+        key = self.feed_key(item)
+        available = self.remaining() - (self.time_budget or 0) * RESERVE_RATIO
+        # Carried-over and unmeasured feeds only need some budget left, otherwise
+        # a slow or new feed would be deferred forever and never re-measured
+        if key in self.carry_over or key not in self.stats:
+            fits = available > 0
+        else:
+            fits = available >= self.estimate(key)
+        if not fits:
+            self.skipped.append(key)
+        return fits
+
+    def fetch_limit(self):
+        """
+        Timeout for the next fetch: the fetcher timeout, shortened so that a
+        feed started near the end cannot run past the budget.
+        """
+        if self.time_budget is None:
+            return None
+        available = self.remaining() - self.time_budget * RESERVE_RATIO
+        return max(min(self.fetch_timeout, available), 0.0)
+
+    def record(self, item, new_entries, fetch_seconds):
+        key = self.feed_key(item)
+        self.fetched += 1
+        stat = self.stats.setdefault(key, {"new_entries": None, "fetch_seconds": fetch_seconds})
+        stat["fetch_seconds"] += EWMA_ALPHA * (fetch_seconds - stat["fetch_seconds"])
+        # new_entries is None when no writer can tell new entries from known ones
+        if new_entries is not None:
+            if stat.get("new_entries") is None:
+                stat["new_entries"] = new_entries
+            else:
+                stat["new_entries"] += EWMA_ALPHA * (new_entries - stat["new_entries"])
+
+    def report(self):
+        used = self.elapsed()
+        if self.time_budget is None:
+            logging.info(f"Run finished in {used:.1f}s: {self.fetched} feeds fetched")
+            return
+        logging.info(
+            f"Time budget: {used:.1f}s used, {max(self.remaining(), 0):.1f}s remaining of {self.time_budget:.1f}s; "
+            f"{self.fetched} feeds fetched, {len(self.skipped)} carried over to the next run"
+        )
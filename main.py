@@ -1,6 +1,9 @@
 from core.yaml_loader import load_feeds
 from core.dispatcher import dispatch_parser
 from core.rss_note_writer import RssNoteRouter   # import the router class now
+from core.http_fetcher import HttpFetcher
+from core.scheduler import FeedScheduler
+from core.profiler import RunProfiler, stage
 import argparse
 
 def parse_args():
@@ -9,12 +12,31 @@ def parse_args():
     group.add_argument("--group", help="Target a specific group from feeds.yml")
     group.add_argument("--all", action="store_true", help="Process all groups in feeds.yml")
 
-    parser.add_argument("--mode", choices=["standard", "obsidian"], default="standard",
-                        help="Choose output mode: standard Markdown or Obsidian Markdown")
+    parser.add_argument("--mode", nargs="+", choices=["standard", "obsidian", "jsonl", "sqlite"],
+                        default=["standard"],
+                        help="Choose one or more output modes: standard Markdown, Obsidian Markdown, "
+                             "gzipped JSONL or SQLite (feeds are fetched once for all modes)")
 
     parser.add_argument("--base-dir", default="vaultRSS",
                         help="Relative base directory for destination notes (default: vaultRSS)")
 
+    parser.add_argument("--timeout", type=float, default=15.0,
+                        help="Hard timeout in seconds for a single feed download (default: 15)")
+    parser.add_argument("--max-bytes", type=int, default=10 * 1024 * 1024,
+                        help="Maximum feed body size in bytes (default: 10 MiB)")
+    parser.add_argument("--host-delay", type=float, default=0.5,
+                        help="Minimum delay in seconds between two requests to the same host (default: 0.5)")
+
+    parser.add_argument("--time-budget", type=float, default=None,
+                        help="Stop starting new feed fetches once this many seconds are nearly spent; "
+                             "deferred feeds run first next time")
+
+    parser.add_argument("--profile", nargs="?", const="profile", default=None, metavar="DIR",
+                        help="Profile the run (wall-clock sampling + tracemalloc per stage and feed) and write "
+                             "collapsed stacks and an allocation report to DIR (default: profile)")
+    parser.add_argument("--profile-top", type=int, default=20,
+                        help="Number of allocation sites listed in the profile report (default: 20)")
+
     parser.add_argument("-vvv", action="store_true", help="Enable verbose debug output")
     return parser.parse_args()
 
@@ -43,12 +65,30 @@ def flatten_group_feeds(group_name, group_config):
 
 def main():
     args = parse_args()
+
+    # nothing is traced unless --profile is given
+    profiler = None
+    if args.profile:
+        profiler = RunProfiler(output_dir=args.profile, top_n=args.profile_top)
+        profiler.start()
+
+    try:
+        run(args)
+    finally:
+        if profiler:
+            profiler.stop()
+
+def run(args):
     feed_tree = load_feeds("feeds.yml")
 
     # instantiate the router once with chosen mode
     
     writer = RssNoteRouter(output_dir=args.base_dir, mode=args.mode)
 
+    # one pooled HTTP client shared by every feed of the run
+    fetcher = HttpFetcher(timeout=args.timeout, max_bytes=args.max_bytes,
+                          host_delay=args.host_delay, verbose=args.vvv)
+
 
     groups_to_process = []
     if args.all:
@@ -59,11 +99,38 @@ def main():
             return
         groups_to_process = [args.group]
 
+    flat_feeds = []
     for group_name in groups_to_process:
         group_config = feed_tree[group_name]
-        flat_feeds = flatten_group_feeds(group_name, group_config)
+        flat_feeds.extend(flatten_group_feeds(group_name, group_config))
+
+    # carried-over feeds first, then by priority and historical value
+    scheduler = FeedScheduler(output_dir=args.base_dir, time_budget=args.time_budget,
+                              fetch_timeout=args.timeout)
+    flat_feeds = scheduler.order(flat_feeds)
+
+    # flush bulk rows and persist the schedule even if a feed or Ctrl-C aborts the run
+    try:
+        process_feeds(args, flat_feeds, scheduler, writer, fetcher)
+    finally:
+        try:
+            # one batched write per run for bulk modes
+            with stage("flush"):
+                writer.close()
+        finally:
+            fetcher.close()
+            scheduler.save()
+            scheduler.report()
+
+def process_feeds(args, flat_feeds, scheduler, writer, fetcher):
+    for item in flat_feeds:
+        subject, sub_subject, feed, filter_tree, max_items = item
+        if not scheduler.should_fetch(item):
+            if args.vvv:
+                print(f"[INFO] Time budget nearly spent — deferring '{feed.get('title', 'Unknown Source')}'")
+            continue
 
-        for subject, sub_subject, feed, filter_tree, max_items in flat_feeds:
+        with stage(f"feed:{scheduler.feed_key(item)}"):
             source_title = feed.get('title', 'Unknown Source')
 
             # Passthrough ONLY if no category block was defined (legacy format)
@@ -80,6 +147,7 @@ def main():
                 }
             max_items = max_items if max_items is not None else 5
 
+            timings = {}
             categorized_entries = dispatch_parser(
                 subject,
                 feed,
@@ -87,16 +155,21 @@ def main():
                 source_title=source_title,
                 max_items=max_items,
                 filter_tree=filter_tree,
-                verbose=args.vvv
+                verbose=args.vvv,
+                fetcher=fetcher,
+                fetch_timeout=scheduler.fetch_limit(),
+                timings=timings
             )
 
             # delegate to the router
-            writer.write_subject_note(
-                subject,
-                sub_subject,
-                source_title,
-                categorized_entries
-            )
+            with stage("write"):
+                new_entries = writer.write_subject_note(
+                    subject,
+                    sub_subject,
+                    source_title,
+                    categorized_entries
+                )
+        scheduler.record(item, new_entries, timings.get("fetch_seconds", 0.0))
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,90 @@
+import gzip
+import json
+import sqlite3
+
+import pytest
+
+from core.rss_note_writer import RssNoteRouter
+from writers.bulk_writer import BulkWriter
+from writers.jsonl_writer import JsonlWriter, JSONL_FILENAME
+from writers.sqlite_writer import SqliteWriter, SQLITE_FILENAME
+
+ENTRIES = {
+    "News": [
+        {"guid": "ID-1", "title": "First", "link": "https://example.org/1", "summary": "one"},
+        {"guid": "id-2", "title": "Second", "link": "https://example.org/2", "summary": "two"},
+    ]
+}
+
+def run_once(writer_class, output_dir):
+    writer = writer_class(output_dir=str(output_dir))
+    writer.write_subject_note("Subject", "Sub", "Source", ENTRIES)
+    writer.close()
+
+def test_sqlite_ignores_entries_already_stored(tmp_path):
+    run_once(SqliteWriter, tmp_path)
+    run_once(SqliteWriter, tmp_path)
+    conn = sqlite3.connect(tmp_path / SQLITE_FILENAME)
+    rows = conn.execute("SELECT guid, title FROM entries ORDER BY guid").fetchall()
+    conn.close()
+    assert rows == [("id-1", "First"), ("id-2", "Second")]
+
+def test_jsonl_stays_readable_after_two_appends(tmp_path):
+    run_once(JsonlWriter, tmp_path)
+    run_once(JsonlWriter, tmp_path)
+    with gzip.open(tmp_path / JSONL_FILENAME, "rt", encoding="utf-8") as f:
+        rows = [json.loads(line) for line in f]
+    assert [r["guid"] for r in rows] == ["id-1", "id-2", "id-1", "id-2"]
+    assert rows[0]["sub_subject"] == "Sub" and rows[0]["category"] == "News"
+
+class FailingWriter(BulkWriter):
+    def flush(self, rows):
+        raise OSError("disk full")
+
+def test_close_keeps_rows_when_flush_fails(tmp_path):
+    writer = FailingWriter(output_dir=str(tmp_path))
+    writer.write_subject_note("Subject", "Sub", "Source", ENTRIES)
+    with pytest.raises(OSError):
+        writer.close()
+    assert len(writer.rows) == 2
+
+def test_missing_flush_fails_at_creation(tmp_path):
+    class Incomplete(BulkWriter):
+        pass
+    with pytest.raises(TypeError):
+        Incomplete(output_dir=str(tmp_path))
+
+class RecordingWriter:
+    def __init__(self, result=None, error=None):
+        self.result = result
+        self.error = error
+        self.closed = False
+
+    def write_subject_note(self, subject, sub_subject, source_title, categorized_entries):
+        return self.result
+
+    def close(self):
+        self.closed = True
+        if self.error:
+            raise self.error
+
+def test_router_closes_every_writer_before_raising(tmp_path):
+    router = RssNoteRouter(output_dir=str(tmp_path), mode=["jsonl", "sqlite"])
+    router.writers = [RecordingWriter(error=OSError("first")), RecordingWriter()]
+    with pytest.raises(OSError, match="first"):
+        router.close()
+    assert all(w.closed for w in router.writers)
+
+def test_router_returns_markdown_count_next_to_bulk_writer(tmp_path):
+    router = RssNoteRouter(output_dir=str(tmp_path), mode=["standard", "sqlite"])
+    assert router.write_subject_note("Subject", "Sub", "Source", ENTRIES) == 2
+    assert router.write_subject_note("Subject", "Sub", "Source", ENTRIES) == 0
+
+def test_router_returns_none_with_only_bulk_writers(tmp_path):
+    router = RssNoteRouter(output_dir=str(tmp_path), mode="jsonl")
+    assert router.write_subject_note("Subject", "Sub", "Source", ENTRIES) is None
+
+def test_router_returns_smallest_known_count(tmp_path):
+    router = RssNoteRouter(output_dir=str(tmp_path), mode="jsonl")
+    router.writers = [RecordingWriter(result=3), RecordingWriter(result=None), RecordingWriter(result=1)]
+    assert router.write_subject_note("Subject", "Sub", "Source", ENTRIES) == 1
@@ -0,0 +1,55 @@
+import time
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+import pytest
+
+from core.dispatcher import dispatch_parser
+from core.http_fetcher import HttpFetcher
+
+RSS = b"""<?xml version="1.0"?>
+<rss version="2.0"><channel><title>Feed</title>
+<item><title>Entry</title><link>https://example.org/entry</link><guid>urn:entry-1</guid></item>
+</channel></rss>
+"""
+
+class FeedHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        if self.path == "/slow":
+            time.sleep(0.15)
+        self.send_response(200)
+        self.send_header("Content-Type", "application/rss+xml")
+        self.send_header("Content-Length", str(len(RSS)))
+        self.end_headers()
+        self.wfile.write(RSS)
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), FeedHandler)
+    httpd.daemon_threads = True
+    thread = threading.Thread(target=httpd.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_port}"
+    httpd.shutdown()
+    httpd.server_close()
+
+def fetch_seconds(url, fetcher):
+    timings = {}
+    categorized = dispatch_parser("subject", {"url": url}, source_title="Feed", timings=timings,
+                                  filter_tree={"All": {"filters": {}}}, fetcher=fetcher)
+    assert [e["guid"] for e in categorized["All"]] == ["urn:entry-1"]
+    return timings["fetch_seconds"]
+
+def test_same_host_fetch_times_exclude_host_delay(server):
+    fetcher = HttpFetcher(timeout=2.0, host_delay=0.4)
+    slow = fetch_seconds(server + "/slow", fetcher)
+    fast = fetch_seconds(server + "/fast", fetcher)
+    fetcher.close()
+    assert fetcher.waited_seconds > 0.2
+    assert 0.15 <= slow < 0.35
+    assert fast < 0.1
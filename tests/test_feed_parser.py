@@ -0,0 +1,18 @@
+from core.feed_parser import FeedParser
+from core.http_fetcher import HttpFetcher
+
+RSS = """<?xml version="1.0"?>
+<rss version="2.0"><channel><title>Local</title>
+<item><title>Hello</title><link>https://example.org/hello</link><guid>hello-1</guid>
+<description>Local entry</description></item>
+</channel></rss>
+"""
+
+def test_local_file_bypasses_http_fetcher(tmp_path):
+    path = tmp_path / "feed.xml"
+    path.write_text(RSS, encoding="utf-8")
+    fetcher = HttpFetcher()
+    entries = FeedParser(str(path), source_title="Local", fetcher=fetcher).parse()
+    fetcher.close()
+    assert [e["guid"] for e in entries] == ["hello-1"]
+    assert entries[0]["source"] == "Local"
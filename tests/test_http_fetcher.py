@@ -0,0 +1,143 @@
+import gzip
+import time
+import zlib
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+import pytest
+
+from core.http_fetcher import HttpFetcher, FetchError
+
+FEED = b"<rss><channel><title>Test</title></channel></rss>"
+
+class FeedHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    connections = set()
+
+    def log_message(self, *args):
+        pass
+
+    def send_body(self, body, encoding=None):
+        self.send_response(200)
+        self.send_header("Content-Type", "application/rss+xml")
+        if encoding:
+            self.send_header("Content-Encoding", encoding)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        FeedHandler.connections.add(self.client_address)
+        if self.path == "/gzip":
+            self.send_body(gzip.compress(FEED), "gzip")
+        elif self.path == "/deflate":
+            self.send_body(zlib.compress(FEED), "deflate")
+        elif self.path == "/raw-deflate":
+            self.send_body(zlib.compress(FEED)[2:-4], "deflate")
+        elif self.path == "/redirect":
+            self.send_response(302)
+            self.send_header("Location", "/plain")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+        elif self.path == "/loop":
+            self.send_response(301)
+            self.send_header("Location", "/loop")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+        elif self.path == "/big":
+            self.send_body(b"x" * 5000)
+        elif self.path == "/bomb":
+            self.send_body(gzip.compress(b"x" * 100000), "gzip")
+        elif self.path == "/slow":
+            self.send_response(200)
+            self.send_header("Content-Length", "100")
+            self.end_headers()
+            for _ in range(100):
+                self.wfile.write(b"x")
+                self.wfile.flush()
+                time.sleep(0.05)
+        else:
+            self.send_body(FEED)
+
+@pytest.fixture
+def server():
+    FeedHandler.connections = set()
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), FeedHandler)
+    httpd.daemon_threads = True
+    thread = threading.Thread(target=httpd.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_port}"
+    httpd.shutdown()
+    httpd.server_close()
+
+@pytest.fixture
+def fetcher():
+    fetcher = HttpFetcher(timeout=2.0, max_bytes=1000, host_delay=0)
+    yield fetcher
+    fetcher.close()
+
+@pytest.mark.parametrize("path", ["/plain", "/gzip", "/deflate", "/raw-deflate"])
+def test_decodes_content_encoding(server, fetcher, path):
+    body, headers, _ = fetcher.fetch(server + path)
+    assert body == FEED
+    assert "content-encoding" not in headers
+    assert headers["content-type"] == "application/rss+xml"
+
+def test_reuses_connection_per_host(server, fetcher):
+    for path in ("/plain", "/gzip", "/plain"):
+        fetcher.fetch(server + path)
+    assert len(FeedHandler.connections) == 1
+
+def test_follows_redirects(server, fetcher):
+    body, headers, url = fetcher.fetch(server + "/redirect")
+    assert body == FEED
+    assert url == server + "/plain"
+    assert headers["content-location"] == url
+
+def test_gives_up_on_redirect_loop(server, fetcher):
+    with pytest.raises(FetchError, match="too many redirects"):
+        fetcher.fetch(server + "/loop")
+
+def test_rejects_body_over_max_bytes(server, fetcher):
+    with pytest.raises(FetchError, match="exceeds"):
+        fetcher.fetch(server + "/big")
+
+def test_rejects_decoded_body_over_max_bytes(server, fetcher):
+    with pytest.raises(FetchError, match="decoded body exceeds"):
+        fetcher.fetch(server + "/bomb")
+
+def test_deadline_bounds_slow_body(server):
+    fetcher = HttpFetcher(timeout=0.5, host_delay=0)
+    started = time.monotonic()
+    with pytest.raises(FetchError):
+        fetcher.fetch(server + "/slow")
+    fetcher.close()
+    assert time.monotonic() - started < 1.0
+
+def test_host_delay_does_not_use_up_the_timeout(server):
+    fetcher = HttpFetcher(timeout=0.3, host_delay=0.5)
+    fetcher.fetch(server + "/plain")
+    body, _, _ = fetcher.fetch(server + "/redirect")
+    fetcher.close()
+    assert body == FEED
+
+def test_only_http_urls_are_supported():
+    assert HttpFetcher.supports("https://www.drupal.org/planet/rss.xml")
+    assert not HttpFetcher.supports("/tmp/feed.xml")
+    assert not HttpFetcher.supports("feed://example.org/rss")
+
+def test_host_delay_spaces_requests(server):
+    fetcher = HttpFetcher(timeout=2.0, host_delay=0.2)
+    started = time.monotonic()
+    fetcher.fetch(server + "/plain")
+    fetcher.fetch(server + "/plain")
+    fetcher.close()
+    assert time.monotonic() - started >= 0.2
+
+def test_per_call_timeout_shortens_deadline(server):
+    fetcher = HttpFetcher(timeout=5.0, host_delay=0)
+    started = time.monotonic()
+    with pytest.raises(FetchError):
+        fetcher.fetch(server + "/slow", timeout=0.3)
+    fetcher.close()
+    assert time.monotonic() - started < 0.8
@@ -0,0 +1,42 @@
+import time
+
+from core import profiler
+from core.profiler import RunProfiler, COLLAPSED_FILENAME, REPORT_FILENAME
+
+def test_stage_is_shared_noop_when_profiling_is_off():
+    assert profiler._active is None
+    assert profiler.stage("fetch") is profiler._NULL_STAGE
+
+def test_nested_stages_build_escaped_paths(tmp_path):
+    run = RunProfiler(output_dir=str(tmp_path))
+    with run.stage("feed:A/sub/a;b"):
+        with run.stage("fetch"):
+            assert run.labels == ("feed:A/sub/a,b", "fetch")
+    assert run.labels == ()
+    assert set(run.stage_calls) == {"feed:A/sub/a,b", "feed:A/sub/a,b;fetch"}
+
+def test_stop_writes_collapsed_stacks_and_report(tmp_path):
+    run = RunProfiler(output_dir=str(tmp_path), interval=0.001, top_n=5)
+    run.start()
+    try:
+        with profiler.stage("feed:A"):
+            with profiler.stage("filter"):
+                deadline = time.monotonic() + 0.1
+                while time.monotonic() < deadline:
+                    sum(range(1000))
+    finally:
+        run.stop()
+    assert profiler._active is None
+
+    lines = (tmp_path / COLLAPSED_FILENAME).read_text(encoding="utf-8").splitlines()
+    assert lines
+    for line in lines:
+        frames, count = line.rsplit(" ", 1)
+        assert int(count) > 0
+        assert frames.split(";")[0]
+    assert any(line.startswith("feed:A;filter;") for line in lines)
+
+    report = (tmp_path / REPORT_FILENAME).read_text(encoding="utf-8")
+    assert "## Stages" in report
+    assert "feed:A;filter\n" in report
+    assert "## Top 5 allocation sites" in report
@@ -0,0 +1,99 @@
+import json
+
+import pytest
+
+from core.scheduler import FeedScheduler, STATE_FILENAME
+
+def item(subject, url, priority=None):
+    feed = {"title": url, "url": url}
+    if priority is not None:
+        feed["priority"] = priority
+    return (subject, "sub", feed, {}, None)
+
+def urls(items):
+    return [i[2]["url"] for i in items]
+
+def write_state(tmp_path, stats=None, carry_over=None):
+    with open(tmp_path / STATE_FILENAME, "w", encoding="utf-8") as f:
+        json.dump({"stats": stats or {}, "carry_over": carry_over or []}, f)
+
+def test_orders_by_carry_over_priority_then_value(tmp_path):
+    write_state(
+        tmp_path,
+        stats={
+            "A/sub/slow": {"new_entries": 1, "fetch_seconds": 10},
+            "A/sub/fast": {"new_entries": 10, "fetch_seconds": 1},
+            "A/sub/carried": {"new_entries": 0, "fetch_seconds": 5},
+        },
+        carry_over=["A/sub/carried"],
+    )
+    scheduler = FeedScheduler(str(tmp_path))
+    feeds = [item("A", "slow"), item("A", "fast"), item("A", "urgent", priority=5), item("A", "carried")]
+    assert urls(scheduler.order(feeds)) == ["carried", "urgent", "fast", "slow"]
+
+def test_unmeasured_feeds_come_first_within_priority(tmp_path):
+    write_state(tmp_path, stats={"A/sub/known": {"new_entries": 10, "fetch_seconds": 1}})
+    scheduler = FeedScheduler(str(tmp_path))
+    assert urls(scheduler.order([item("A", "known"), item("A", "new")])) == ["new", "known"]
+
+def test_non_numeric_priority_is_ignored(tmp_path):
+    scheduler = FeedScheduler(str(tmp_path))
+    feeds = [item("A", "bad", priority="high"), item("A", "good", priority="2")]
+    assert urls(scheduler.order(feeds)) == ["good", "bad"]
+
+def test_unmeasured_feed_fetched_with_small_budget(tmp_path):
+    scheduler = FeedScheduler(str(tmp_path), time_budget=5, fetch_timeout=15)
+    assert scheduler.should_fetch(item("A", "new"))
+
+def test_skips_measured_feed_that_does_not_fit(tmp_path):
+    write_state(tmp_path, stats={"A/sub/slow": {"new_entries": 1, "fetch_seconds": 19}})
+    scheduler = FeedScheduler(str(tmp_path), time_budget=30, fetch_timeout=15)
+    scheduler.started -= 20
+    assert not scheduler.should_fetch(item("A", "slow"))
+    assert scheduler.skipped == ["A/sub/slow"]
+
+def test_estimate_is_capped_by_fetch_timeout(tmp_path):
+    write_state(tmp_path, stats={"A/sub/slow": {"new_entries": 1, "fetch_seconds": 19}})
+    scheduler = FeedScheduler(str(tmp_path), time_budget=20, fetch_timeout=15)
+    assert scheduler.should_fetch(item("A", "slow"))
+
+def test_carried_over_feed_fetched_despite_slow_history(tmp_path):
+    write_state(
+        tmp_path,
+        stats={"A/sub/slow": {"new_entries": 1, "fetch_seconds": 19}},
+        carry_over=["A/sub/slow"],
+    )
+    scheduler = FeedScheduler(str(tmp_path), time_budget=5, fetch_timeout=15)
+    assert scheduler.should_fetch(item("A", "slow"))
+
+def test_nothing_fetched_once_budget_is_spent(tmp_path):
+    scheduler = FeedScheduler(str(tmp_path), time_budget=1)
+    scheduler.started -= 1
+    assert not scheduler.should_fetch(item("A", "new"))
+
+def test_save_keeps_carry_over_of_other_groups(tmp_path):
+    write_state(tmp_path, carry_over=["B/sub/other", "A/sub/done"])
+    scheduler = FeedScheduler(str(tmp_path), time_budget=0)
+    feeds = scheduler.order([item("A", "done"), item("A", "late")])
+    scheduler.should_fetch(feeds[1])
+    scheduler.save()
+    state = json.loads((tmp_path / STATE_FILENAME).read_text(encoding="utf-8"))
+    assert state["carry_over"] == ["A/sub/late", "B/sub/other"]
+
+def test_record_without_new_entry_count(tmp_path):
+    scheduler = FeedScheduler(str(tmp_path))
+    feed = item("A", "bulk")
+    scheduler.record(feed, None, 2.0)
+    assert scheduler.stats["A/sub/bulk"] == {"new_entries": None, "fetch_seconds": 2.0}
+    assert scheduler.value("A/sub/bulk") == 0.0
+    scheduler.record(feed, 4, 2.0)
+    assert scheduler.value("A/sub/bulk") == 2.0
+
+def test_fetch_limit_shrinks_to_remaining_budget(tmp_path):
+    scheduler = FeedScheduler(str(tmp_path), time_budget=20, fetch_timeout=15)
+    assert scheduler.fetch_limit() == pytest.approx(15)
+    scheduler.started -= 17
+    assert scheduler.fetch_limit() == pytest.approx(2, abs=0.1)
+
+def test_no_fetch_limit_without_budget(tmp_path):
+    assert FeedScheduler(str(tmp_path), fetch_timeout=15).fetch_limit() is None
@@ -0,0 +1,61 @@
+import os
+import logging
+from abc import ABC, abstractmethod
+from datetime import datetime
+
+ENTRY_FIELDS = ("guid", "title", "link", "published", "author", "summary", "source")
+
+class BulkWriter(ABC):
+    """
+    Base class for bulk writers: rows are buffered in memory by
+    write_subject_note() and written in a single batch by close().
+    """
+
+    def __init__(self, output_dir="vault"):
+        self.output_dir = output_dir
+        self.rows = []
+        self.run_started = datetime.now().isoformat()
+
+    def build_row(self, subject, sub_subject, source_title, category, entry):
+        row = {
+            "subject": subject,
+            "sub_subject": sub_subject or "General",
+            "source_title": source_title,
+            "category": category,
+            "fetched_at": self.run_started,
+        }
+        for field in ENTRY_FIELDS:
+            row[field] = entry.get(field, "")
+        row["guid"] = row["guid"].strip().lower()
+        return row
+
+    def write_subject_note(self, subject, sub_subject, source_title, categorized_entries):
+        """
+        Buffer entries for the final batched write. Returns None: bulk writers
+        do not know which entries are new.
+        """
+        new_total = 0
+        for category, entries in categorized_entries.items():
+            for entry in entries:
+                self.rows.append(self.build_row(subject, sub_subject, source_title, category, entry))
+                new_total += 1
+        logging.info(f"{new_total} entries buffered for '{subject}/{sub_subject or 'General'}/{source_title}'")
+        return None
+
+    @abstractmethod
+    def flush(self, rows):
+        """
+        Write all rows in a single batch.
+        """
+
+    def close(self):
+        if not self.rows:
+            return
+        os.makedirs(self.output_dir, exist_ok=True)
+        try:
+            self.flush(self.rows)
+        except Exception as e:
+            # Keep the rows in memory and fail the run loudly instead of dropping them
+            logging.error(f"Bulk write failed in {type(self).__name__}: {e}")
+            raise
+        self.rows = []
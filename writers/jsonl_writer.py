@@ -0,0 +1,22 @@
+import os
+import gzip
+import json
+import logging
+from writers.bulk_writer import BulkWriter
+
+JSONL_FILENAME = "rss_entries.jsonl.gz"
+
+class JsonlWriter(BulkWriter):
+    def __init__(self, output_dir="vault"):
+        super().__init__(output_dir=output_dir)
+        self.file_path = os.path.join(output_dir, JSONL_FILENAME)
+
+    def flush(self, rows):
+        """
+        Append all buffered rows as one gzip member. Readers such as
+        gzip.open() transparently concatenate members across runs.
+        """
+        payload = "".join(json.dumps(row, ensure_ascii=False) + "\n" for row in rows)
+        with gzip.open(self.file_path, "at", encoding="utf-8") as f:
+            f.write(payload)
+        logging.info(f"{len(rows)} entries appended to {self.file_path}")
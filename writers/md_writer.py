@@ -8,6 +8,7 @@ from datetime import datetime
 from parsers.md_parsers.parser import extract_existing_entries
 from archivers.archiver import archive_removed_entries
 from core.indexer import update_index
+from core.profiler import stage
 
 MAX_FILENAME_LEN = 100  # Safe filename length for Windows
 
@@ -163,7 +164,8 @@ archive: [[{archive_name}]]
                 filtered_by_category[category] = filtered
 
         all_entries = [e for entries in categorized_entries.values() for e in entries if e.get('guid')]
-        archive_removed_entries(file_path, archive_path, all_entries)
+        with stage("archive"):
+            archive_removed_entries(file_path, archive_path, all_entries)
 
         self.write_feed_note(file_path, source_title, subject, sub_subject, categorized_entries)
 
@@ -176,4 +178,5 @@ archive: [[{archive_name}]]
         update_index(subject_index_path, subject_index_entry, f"# {subject} Index", [subject])
 
         new_total = sum(len(v) for v in filtered_by_category.values())
-        logging.info(f"{new_total} new entries for '{subject}/{sub_subject or 'General'}/{source_title}'")
\ No newline at end of file
+        logging.info(f"{new_total} new entries for '{subject}/{sub_subject or 'General'}/{source_title}'")
+        return new_total
\ No newline at end of file
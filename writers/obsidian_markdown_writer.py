@@ -67,7 +67,7 @@ created: {datetime.now().isoformat()}
         file_path = os.path.join(folder, f"{title}.md")
 
         if os.path.exists(file_path):
-            return  # skip duplicates
+            return False  # skip duplicates
 
         with open(file_path, "w", encoding="utf-8") as f:
             f.write("---\n")
@@ -96,17 +96,19 @@ created: {datetime.now().isoformat()}
         if author_field:
             for author in [a.strip() for a in author_field.split(",") if a.strip()]:
                 self.write_author_note(author, subject, source_title, entry.get("title", "Untitled"))
+        return True
 
     def write_feed_notes(self, subject, sub_subject, source_title, categorized_entries):
         new_total = 0
         for category, entries in categorized_entries.items():
             for entry in entries:
-                self.write_entry_note(subject, sub_subject, source_title, entry, category)
-                new_total += 1
+                if self.write_entry_note(subject, sub_subject, source_title, entry, category):
+                    new_total += 1
         logging.info(f"{new_total} new Obsidian entries for '{subject}/{sub_subject or 'General'}/{source_title}'")
+        return new_total
 
     def write_subject_note(self, subject, sub_subject, source_title, categorized_entries):
         """
         Full orchestration for Obsidian mode: atomic notes, author notes at subject/_authors.
         """
-        self.write_feed_notes(subject, sub_subject, source_title, categorized_entries)
\ No newline at end of file
+        return self.write_feed_notes(subject, sub_subject, source_title, categorized_entries)
\ No newline at end of file
@@ -0,0 +1,42 @@
+import os
+import sqlite3
+import logging
+from writers.bulk_writer import BulkWriter
+
+SQLITE_FILENAME = "rss_entries.db"
+
+COLUMNS = (
+    "guid", "subject", "sub_subject", "source_title", "category",
+    "title", "link", "published", "author", "summary", "source", "fetched_at",
+)
+
+class SqliteWriter(BulkWriter):
+    def __init__(self, output_dir="vault"):
+        super().__init__(output_dir=output_dir)
+        self.db_path = os.path.join(output_dir, SQLITE_FILENAME)
+
+    def flush(self, rows):
+        """
+        Insert all buffered rows in a single transaction. Entries already
+        stored for the same feed and category are ignored.
+        """
+        placeholders = ", ".join("?" for _ in COLUMNS)
+        values = [tuple(row[c] for c in COLUMNS) for row in rows]
+
+        conn = sqlite3.connect(self.db_path)
+        try:
+            with conn:
+                conn.execute(f"""
+                    CREATE TABLE IF NOT EXISTS entries (
+                        {", ".join(f"{c} TEXT" for c in COLUMNS)},
+                        UNIQUE (guid, subject, sub_subject, source_title, category)
+                    )""")
+                before = conn.total_changes
+                conn.executemany(
+                    f"INSERT OR IGNORE INTO entries ({', '.join(COLUMNS)}) VALUES ({placeholders})",
+                    values
+                )
+                inserted = conn.total_changes - before
+        finally:
+            conn.close()
+        logging.info(f"{inserted} new entries inserted into {self.db_path}")